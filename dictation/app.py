@@ -52,6 +52,8 @@ class DictationApp:
         if clipboard is not None:
             self._clipboard_helper = ClipboardHelper(clipboard)
             self._dictation_controller = DictationController(clipboard)
+            # Load the Whisper model and audio filter before the first dictation
+            self._dictation_controller.warm_up()
 
         # Set up IPC server
         self._ipc_server = IPCServer()
@@ -77,16 +79,22 @@ class DictationApp:
 
         if not self._engine.rootObjects():
             print("Failed to load QML", file=sys.stderr)
+            # The controller's worker thread is already running
+            self._cleanup()
             return 1
 
         # Run event loop
         exit_code = self._app.exec()
 
-        # Cleanup
+        self._cleanup()
+        return exit_code
+
+    def _cleanup(self) -> None:
+        """Stop the IPC server and the controller's worker thread."""
         if self._ipc_server is not None:
             self._ipc_server.stop()
-
-        return exit_code
+        if self._dictation_controller is not None:
+            self._dictation_controller.shutdown()
 
     def _get_root_window(self) -> QObject | None:
         """Get the root window object."""
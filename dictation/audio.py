@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
-import tempfile
-import wave
-from pathlib import Path
 from typing import TYPE_CHECKING
 
 import numpy as np
 import sounddevice as sd
+from PySide6.QtCore import QObject, QTimer, Signal
 from scipy.signal import butter, sosfilt
 
+try:
+    from numba import njit
+except ImportError:  # Optional: installed with the "native" extra
+    njit = None
+
 if TYPE_CHECKING:
     from numpy.typing import NDArray
 
@@ -20,85 +23,237 @@ CHANNELS = 1  # Mono
 DTYPE = np.float32  # sounddevice default
 BANDPASS_LOW = 80  # Hz - removes low-frequency rumble
 BANDPASS_HIGH = 7000  # Hz - removes high-frequency hiss
+MAX_RECORDING_SECONDS = 600  # Recording auto-stops here (~38MB of samples)
+MAX_RECORDING_SAMPLES = SAMPLE_RATE * MAX_RECORDING_SECONDS
+RING_CAPACITY = 1 << 20  # Samples (~65s) between callback and consumer
+DRAIN_INTERVAL_MS = 50  # How often the Qt thread drains the ring buffer
+
+
+def _design_bandpass(sample_rate: int) -> NDArray[np.float32]:
+    """Design the speech bandpass filter as float32 second-order sections."""
+    sos = butter(
+        4, [BANDPASS_LOW, BANDPASS_HIGH], btype="band", fs=sample_rate, output="sos"
+    )
+    return np.asarray(sos, dtype=np.float32)
+
+
+# Filter coefficients only depend on constants, so design them once
+_BANDPASS_SOS = _design_bandpass(SAMPLE_RATE)
+
+
+def _sosfilt_loop(
+    sos: NDArray[np.float32], x: NDArray[np.float32], zi: NDArray[np.float32]
+) -> None:
+    """Direct-form II transposed SOS filter, in place on float32 data."""
+    for n in range(x.shape[0]):
+        v = x[n]
+        for s in range(sos.shape[0]):
+            y = sos[s, 0] * v + zi[s, 0]
+            zi[s, 0] = sos[s, 1] * v - sos[s, 4] * y + zi[s, 1]
+            zi[s, 1] = sos[s, 2] * v - sos[s, 5] * y
+            v = y
+        x[n] = v
+
+
+def _sosfilt_inplace_scipy(
+    sos: NDArray[np.float32], x: NDArray[np.float32], zi: NDArray[np.float32]
+) -> None:
+    """Filter ``x`` in place with scipy, updating ``zi``.
+
+    All inputs are float32, so scipy filters without upcasting to float64.
+    """
+    x[:], zi[:] = sosfilt(sos, x, zi=zi)
+
+
+# The per-sample loop is only fast once compiled; without numba, use scipy
+if njit is not None:
+    _sosfilt_inplace = njit(cache=True, fastmath=True)(_sosfilt_loop)
+else:
+    _sosfilt_inplace = _sosfilt_inplace_scipy
+
+
+def warm_up_filter() -> None:
+    """Compile the filter ahead of the first recording, which runs it live."""
+    zi = np.zeros((_BANDPASS_SOS.shape[0], 2), dtype=np.float32)
+    _sosfilt_inplace(_BANDPASS_SOS, np.zeros(1, dtype=np.float32), zi)
 
 
 def apply_bandpass_filter(
     audio: NDArray[np.float32], sample_rate: int
 ) -> NDArray[np.float32]:
     """Apply bandpass filter to isolate speech frequencies (80Hz - 7kHz)."""
-    sos = butter(
-        4, [BANDPASS_LOW, BANDPASS_HIGH], btype="band", fs=sample_rate, output="sos"
-    )
-    filtered = np.asarray(sosfilt(sos, audio), dtype=np.float32)
+    if sample_rate == SAMPLE_RATE:
+        sos = _BANDPASS_SOS
+    else:
+        sos = _design_bandpass(sample_rate)
+    filtered = np.array(audio, dtype=np.float32)
+    _sosfilt_inplace(sos, filtered, np.zeros((sos.shape[0], 2), dtype=np.float32))
     return filtered
 
 
-class AudioRecorder:
-    """Records audio from the default microphone."""
+def clip_to_full_scale(audio: NDArray[np.float32]) -> NDArray[np.float32]:
+    """Saturate samples to [-1, 1] in place (what 16-bit PCM would hold)."""
+    np.clip(audio, -1.0, 1.0, out=audio)
+    return audio
 
-    def __init__(self) -> None:
-        self._frames: list[NDArray[np.float32]] = []
-        self._stream: sd.InputStream | None = None
+
+class RingBuffer:
+    """Single-producer/single-consumer ring buffer of float32 samples.
+
+    The producer only ever advances ``_head`` and the consumer only ever
+    advances ``_tail``, so the audio thread never takes a lock or allocates.
+    Capacity must be a power of two so wrapping is a bit mask.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0 or capacity & (capacity - 1):
+            raise ValueError("capacity must be a power of two")
+        self._data: NDArray[np.float32] = np.empty(capacity, dtype=np.float32)
+        self._mask = capacity - 1
+        self._head = 0  # Total samples written (producer)
+        self._tail = 0  # Total samples read (consumer)
+
+    def __len__(self) -> int:
+        """Return the number of samples waiting to be read."""
+        return self._head - self._tail
+
+    def clear(self) -> None:
+        """Discard all samples. Only call while no producer is running."""
+        self._head = 0
+        self._tail = 0
+
+    def write(self, block: NDArray[np.float32]) -> int:
+        """Copy a block in (producer side). Returns the number of samples dropped."""
+        head = self._head
+        free = len(self._data) - (head - self._tail)
+        n = min(len(block), free)
+        start = head & self._mask
+        first = min(n, len(self._data) - start)
+        self._data[start : start + first] = block[:first]
+        self._data[: n - first] = block[first:n]
+        # Publish only after the samples are in place
+        self._head = head + n
+        return len(block) - n
+
+    def read_into(self, out: NDArray[np.float32]) -> int:
+        """Move up to ``len(out)`` samples into ``out`` (consumer side).
+
+        Returns the number of samples copied.
+        """
+        tail = self._tail
+        n = min(self._head - tail, len(out))
+        start = tail & self._mask
+        first = min(n, len(self._data) - start)
+        out[:first] = self._data[start : start + first]
+        out[first:n] = self._data[: n - first]
+        self._tail = tail + n
+        return n
+
+
+class AudioRecorder(QObject):
+    """Records audio from the default microphone.
+
+    The sounddevice callback only pushes samples into a ring buffer; a Qt
+    timer drains them into the recording buffer on the Qt thread, running
+    the bandpass filter block by block as it goes.
+
+    Recordings are capped at MAX_RECORDING_SECONDS, so the buffer is sized
+    once and never grows. When the cap is hit the stream stops itself and
+    ``auto_stopped`` is emitted; the owner should then call ``stop()``.
+    """
+
+    auto_stopped = Signal()
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._ring = RingBuffer(RING_CAPACITY)
+        self._buffer: NDArray[np.float32] = np.empty(0, dtype=np.float32)
+        self._write_index: int = 0
+        self._captured: int = 0  # Samples the callback got into the ring
+        self._zi: NDArray[np.float32] = np.zeros(
+            (_BANDPASS_SOS.shape[0], 2), dtype=np.float32
+        )
+        self._stream: sd.RawInputStream | None = None
         self._is_recording: bool = False
 
+        self._drain_timer = QTimer(self)
+        self._drain_timer.setInterval(DRAIN_INTERVAL_MS)
+        self._drain_timer.timeout.connect(self._drain)
+
     def start(self) -> None:
         """Start recording audio."""
-        self._frames = []
+        # Fresh buffer per recording: stop() hands out a view of the old one
+        self._buffer = np.empty(MAX_RECORDING_SAMPLES, dtype=np.float32)
+        self._write_index = 0
+        self._captured = 0
+        self._zi = np.zeros((_BANDPASS_SOS.shape[0], 2), dtype=np.float32)
+        self._ring.clear()
         self._is_recording = True
-        self._stream = sd.InputStream(
+        # Raw stream: the callback gets the PortAudio buffer itself, not a
+        # (frames, channels) ndarray wrapper built for every block
+        self._stream = sd.RawInputStream(
             samplerate=SAMPLE_RATE,
             channels=CHANNELS,
             dtype=DTYPE,
             callback=self._audio_callback,
         )
         self._stream.start()
+        self._drain_timer.start()
+
+    def stop(self) -> NDArray[np.float32]:
+        """Stop recording and return the filtered mono samples.
 
-    def stop(self) -> Path:
-        """Stop recording and return path to temporary WAV file."""
+        The array is float32 at SAMPLE_RATE, which faster-whisper accepts
+        directly without a round-trip through a WAV file. Only the last few
+        milliseconds are filtered here; any full-length pass (such as
+        ``clip_to_full_scale``) is left to the consumer's thread.
+        """
         self._is_recording = False
         if self._stream is not None:
             self._stream.stop()
             self._stream.close()
             self._stream = None
+        self._drain_timer.stop()
+        self._drain()
 
-        # Handle case where no audio was recorded
-        if not self._frames:
-            # Create empty audio data
-            audio_data = np.array([], dtype=np.float32)
-        else:
-            # Concatenate all frames and apply bandpass filter
-            audio_data = np.concatenate(self._frames, axis=0)
-            audio_data = apply_bandpass_filter(audio_data, SAMPLE_RATE)
-
-        # Save to temporary WAV file
-        temp_file = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-        temp_path = Path(temp_file.name)
-        temp_file.close()
-
-        # Write WAV file (convert float32 to int16 for WAV)
-        if len(audio_data) > 0:
-            audio_int16 = (audio_data * 32767).astype(np.int16)
-        else:
-            audio_int16 = np.array([], dtype=np.int16)
-
-        with wave.open(str(temp_path), "wb") as wf:
-            wf.setnchannels(CHANNELS)
-            wf.setsampwidth(2)  # 16-bit
-            wf.setframerate(SAMPLE_RATE)
-            wf.writeframes(audio_int16.tobytes())
-
-        return temp_path
+        # Samples were filtered as they were drained, so no full pass here
+        return self._buffer[: self._write_index]
 
     def _audio_callback(
         self,
-        indata: NDArray[np.float32],
+        indata: memoryview,
         frames: int,
         time_info: dict,
         status: sd.CallbackFlags,
     ) -> None:
         """Callback for audio stream - called from separate thread."""
-        if self._is_recording:
-            self._frames.append(indata.copy())
+        if not self._is_recording:
+            return
+
+        # Mono, so the raw buffer is already a flat run of samples
+        block = np.frombuffer(indata, dtype=np.float32, count=frames)
+        remaining = MAX_RECORDING_SAMPLES - self._captured
+        accepted = min(frames, remaining)
+        # Only count samples the ring buffer took, so the drain side reaches
+        # the cap exactly when the stream stops
+        self._captured += accepted - self._ring.write(block[:accepted])
+        if self._captured >= MAX_RECORDING_SAMPLES:
+            raise sd.CallbackStop
+
+    def _drain(self) -> None:
+        """Filter pending samples from the ring buffer into the recording buffer."""
+        pending = len(self._ring)
+        if pending > 0:
+            start = self._write_index
+            end = start + pending
+            block = self._buffer[start:end]
+            self._ring.read_into(block)
+            _sosfilt_inplace(_BANDPASS_SOS, block, self._zi)
+            self._write_index = end
+
+        if self._write_index >= MAX_RECORDING_SAMPLES and self._drain_timer.isActive():
+            self._drain_timer.stop()
+            self.auto_stopped.emit()
 
     @property
     def is_recording(self) -> bool:
@@ -45,12 +45,16 @@ class DictationController(QObject):
         self._original_text: str = ""  # For undo functionality
         self._error_message: str = ""
         self._progress_message: str = ""
+        self._can_undo: bool = False
         self._clipboard = clipboard
 
         # Components
-        self._recorder = AudioRecorder()
+        self._recorder = AudioRecorder(self)
         self._transcriber = Transcriber(self)
 
+        # Transcribe what we have if the recording hits its length cap
+        self._recorder.auto_stopped.connect(self._on_recording_auto_stopped)
+
         # Connect transcriber signals
         self._transcriber.transcription_finished.connect(
             self._on_transcription_finished
@@ -100,9 +104,7 @@ class DictationController(QObject):
     @Property(bool, notify=canUndoChanged)
     def canUndo(self) -> bool:
         """True if undo is available (text has been formatted)."""
-        return bool(
-            self._original_text and self._original_text != self._transcribed_text
-        )
+        return self._can_undo
 
     # --- Slots for QML ---
 
@@ -157,16 +159,14 @@ class DictationController(QObject):
 
         api_key = os.environ.get("OPENAI_API_KEY")
         if not api_key:
-            self._error_message = "OPENAI_API_KEY not set"
-            self.errorMessageChanged.emit()
+            self._set_error_message("OPENAI_API_KEY not set")
             return
 
         # Store original for undo (only if not already stored)
         if not self._original_text:
-            self._original_text = self._transcribed_text
+            self._set_original_text(self._transcribed_text)
 
-        self._progress_message = "Formatting with GPT..."
-        self.progressMessageChanged.emit()
+        self._set_progress_message("Formatting with GPT...")
 
         try:
             client = OpenAI(api_key=api_key)
@@ -194,26 +194,19 @@ Your task:
             )
 
             formatted = response.choices[0].message.content
-            self._transcribed_text = formatted
-            self._progress_message = ""
-            self.transcribedTextChanged.emit()
-            self.progressMessageChanged.emit()
-            self.canUndoChanged.emit()
+            self._set_transcribed_text(formatted)
+            self._set_progress_message("")
 
         except Exception as e:
-            self._error_message = f"GPT formatting failed: {e}"
-            self._progress_message = ""
-            self.errorMessageChanged.emit()
-            self.progressMessageChanged.emit()
+            self._set_error_message(f"GPT formatting failed: {e}")
+            self._set_progress_message("")
 
     @Slot()
     def undoFormat(self) -> None:
         """Revert to original transcribed text."""
         if self._original_text:
-            self._transcribed_text = self._original_text
-            self._original_text = ""
-            self.transcribedTextChanged.emit()
-            self.canUndoChanged.emit()
+            self._set_transcribed_text(self._original_text)
+            self._set_original_text("")
 
     @Slot()
     def copyOriginal(self) -> None:
@@ -226,81 +219,116 @@ Your task:
         """Reset to idle state."""
         self._reset()
 
+    # --- Lifecycle ---
+
+    def warm_up(self) -> None:
+        """Preload the transcription model and audio filter in the background."""
+        self._transcriber.warm_up()
+
+    def shutdown(self) -> None:
+        """Stop background threads before the application exits."""
+        self._transcriber.shutdown()
+
+    # --- Property setters (emit only when the value changes) ---
+
+    def _set_state(self, state: DictationState) -> None:
+        """Set the state, notifying QML if it changed."""
+        if state != self._state:
+            self._state = state
+            self.stateChanged.emit()
+
+    def _set_transcribed_text(self, text: str) -> None:
+        """Set the transcribed text, notifying QML if it changed."""
+        if text != self._transcribed_text:
+            self._transcribed_text = text
+            self.transcribedTextChanged.emit()
+            self._update_can_undo()
+
+    def _set_original_text(self, text: str) -> None:
+        """Set the pre-formatting text kept for undo."""
+        if text != self._original_text:
+            self._original_text = text
+            self._update_can_undo()
+
+    def _set_error_message(self, message: str) -> None:
+        """Set the error message, notifying QML if it changed."""
+        if message != self._error_message:
+            self._error_message = message
+            self.errorMessageChanged.emit()
+
+    def _set_progress_message(self, message: str) -> None:
+        """Set the progress message, notifying QML if it changed."""
+        if message != self._progress_message:
+            self._progress_message = message
+            self.progressMessageChanged.emit()
+
+    def _update_can_undo(self) -> None:
+        """Recompute canUndo, notifying QML if it changed."""
+        can_undo = bool(
+            self._original_text and self._original_text != self._transcribed_text
+        )
+        if can_undo != self._can_undo:
+            self._can_undo = can_undo
+            self.canUndoChanged.emit()
+
     # --- Internal methods ---
 
     def _start_recording(self) -> None:
         """Start audio recording."""
-        self._error_message = ""
-        self._transcribed_text = ""
-        self._progress_message = ""
-        self._state = DictationState.RECORDING
-        self.stateChanged.emit()
-        self.transcribedTextChanged.emit()
-        self.errorMessageChanged.emit()
+        self._set_error_message("")
+        self._set_transcribed_text("")
+        self._set_progress_message("")
+        self._set_state(DictationState.RECORDING)
 
         try:
             self._recorder.start()
         except Exception as e:
-            self._error_message = f"Failed to start recording: {e}"
-            self._state = DictationState.ERROR
-            self.stateChanged.emit()
-            self.errorMessageChanged.emit()
+            self._set_error_message(f"Failed to start recording: {e}")
+            self._set_state(DictationState.ERROR)
 
     def _stop_recording(self) -> None:
         """Stop recording and start transcription."""
         try:
-            audio_path = self._recorder.stop()
-            self._state = DictationState.TRANSCRIBING
-            self._progress_message = "Starting transcription..."
-            self.stateChanged.emit()
-            self.progressMessageChanged.emit()
+            audio = self._recorder.stop()
+            self._set_state(DictationState.TRANSCRIBING)
+            self._set_progress_message("Starting transcription...")
 
             # Start transcription
-            self._transcriber.transcribe(audio_path)
+            self._transcriber.transcribe(audio)
 
         except Exception as e:
-            self._error_message = f"Failed to stop recording: {e}"
-            self._state = DictationState.ERROR
-            self.stateChanged.emit()
-            self.errorMessageChanged.emit()
+            self._set_error_message(f"Failed to stop recording: {e}")
+            self._set_state(DictationState.ERROR)
+
+    def _on_recording_auto_stopped(self) -> None:
+        """Handle the recorder reaching its maximum length."""
+        if self._state == DictationState.RECORDING:
+            self._stop_recording()
 
     def _on_transcription_finished(self, text: str) -> None:
         """Handle transcription completion."""
-        self._transcribed_text = text
-        self._original_text = ""  # Clear any previous original
-        self._progress_message = ""
-        self._state = DictationState.COMPLETED
-        self.stateChanged.emit()
-        self.transcribedTextChanged.emit()
-        self.progressMessageChanged.emit()
-        self.canUndoChanged.emit()
+        self._set_transcribed_text(text)
+        self._set_original_text("")  # Clear any previous original
+        self._set_progress_message("")
+        self._set_state(DictationState.COMPLETED)
 
         # Auto-copy to clipboard
         self.copyToClipboard()
 
     def _on_transcription_error(self, error: str) -> None:
         """Handle transcription error."""
-        self._error_message = error
-        self._progress_message = ""
-        self._state = DictationState.ERROR
-        self.stateChanged.emit()
-        self.errorMessageChanged.emit()
-        self.progressMessageChanged.emit()
+        self._set_error_message(error)
+        self._set_progress_message("")
+        self._set_state(DictationState.ERROR)
 
     def _on_transcription_progress(self, message: str) -> None:
         """Handle progress updates."""
-        self._progress_message = message
-        self.progressMessageChanged.emit()
+        self._set_progress_message(message)
 
     def _reset(self) -> None:
         """Reset to idle state."""
-        self._transcribed_text = ""
-        self._original_text = ""
-        self._error_message = ""
-        self._progress_message = ""
-        self._state = DictationState.IDLE
-        self.stateChanged.emit()
-        self.transcribedTextChanged.emit()
-        self.errorMessageChanged.emit()
-        self.progressMessageChanged.emit()
-        self.canUndoChanged.emit()
+        self._set_transcribed_text("")
+        self._set_original_text("")
+        self._set_error_message("")
+        self._set_progress_message("")
+        self._set_state(DictationState.IDLE)
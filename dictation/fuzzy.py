@@ -10,8 +10,19 @@ path-like strings. It uses subsequence matching with scoring based on:
 
 from __future__ import annotations
 
+import heapq
+from array import array
 from collections.abc import Callable, Sequence
 from dataclasses import dataclass
+from functools import cache, cached_property
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+    from numpy.typing import NDArray
 
 # Scoring constants (tuned for path matching)
 SCORE_CONSECUTIVE = 16
@@ -21,6 +32,18 @@ SCORE_GAP_PENALTY = -3
 
 # Characters that define word boundaries in paths
 WORD_BOUNDARY_CHARS = frozenset("/_-. ")
+_WORD_BOUNDARY_BYTES = np.frombuffer(b"/_-. ", dtype=np.uint8)
+
+# array typecode for FuzzyMatch.positions (unsigned 32-bit): a few bytes per
+# match rather than an int object each
+_POSITION_TYPECODE = "I"
+
+# Score for candidates that don't match (fuzzy_score returns None)
+NO_MATCH = -(2**31)
+
+# Skip candidates longer than this many times the query length; such long
+# gaps score poorly anyway. None keeps every candidate (exact results).
+MAX_LENGTH_RATIO: int | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -28,7 +51,12 @@ class FuzzyMatch:
     """Result of fuzzy matching with score and match positions."""
 
     score: int
-    positions: tuple[int, ...]
+    positions: bytes  # Matched target indices, packed as _POSITION_TYPECODE
+
+    @property
+    def indices(self) -> memoryview:
+        """The matched target indices, as a read-only sequence of ints."""
+        return memoryview(self.positions).cast(_POSITION_TYPECODE)
 
 
 def _is_word_boundary(target: str, index: int) -> bool:
@@ -59,7 +87,7 @@ def fuzzy_match(query: str, target: str) -> FuzzyMatch | None:
     - Earlier matches
     """
     if not query:
-        return FuzzyMatch(score=0, positions=())
+        return FuzzyMatch(score=0, positions=b"")
 
     query_lower = query.lower()
     target_lower = target.lower()
@@ -72,50 +100,54 @@ def fuzzy_match(query: str, target: str) -> FuzzyMatch | None:
 
     # Find all possible positions for each query character
     # This enables finding the optimal alignment
-    positions: list[int] = []
+    positions = array(_POSITION_TYPECODE)
     score = 0
     target_idx = 0
     prev_match_idx = -1
 
     for query_idx, query_char in enumerate(query_lower):
-        # Find next occurrence of query_char in target
-        found = False
-        while target_idx < target_len:
-            if target_lower[target_idx] == query_char:
-                positions.append(target_idx)
-
-                # Score this match
-                if query_idx == 0 and target_idx == 0:
-                    score += SCORE_FIRST_CHAR
-
-                if _is_word_boundary(target, target_idx):
-                    score += SCORE_WORD_BOUNDARY
-
-                if prev_match_idx >= 0:
-                    gap = target_idx - prev_match_idx - 1
-                    if gap == 0:
-                        score += SCORE_CONSECUTIVE
-                    else:
-                        score += gap * SCORE_GAP_PENALTY
-
-                prev_match_idx = target_idx
-                target_idx += 1
-                found = True
-                break
-            target_idx += 1
-
-        if not found:
+        # Find next occurrence of query_char in target (a memchr scan)
+        target_idx = target_lower.find(query_char, target_idx, target_len)
+        if target_idx == -1:
             return None
+        positions.append(target_idx)
+
+        # Score this match
+        if query_idx == 0 and target_idx == 0:
+            score += SCORE_FIRST_CHAR
+
+        if _is_word_boundary(target, target_idx):
+            score += SCORE_WORD_BOUNDARY
+
+        if prev_match_idx >= 0:
+            gap = target_idx - prev_match_idx - 1
+            if gap == 0:
+                score += SCORE_CONSECUTIVE
+            else:
+                score += gap * SCORE_GAP_PENALTY
 
-    return FuzzyMatch(score=score, positions=tuple(positions))
+        prev_match_idx = target_idx
+        target_idx += 1
 
+    return FuzzyMatch(score=score, positions=positions.tobytes())
 
-def fuzzy_score(query: str, target: str) -> int | None:
+
+def word_boundaries(target: str) -> bytes:
+    """Precompute _is_word_boundary for every position, one byte each."""
+    return bytes(_is_word_boundary(target, i) for i in range(len(target)))
+
+
+def fuzzy_score(
+    query: str, target: str, boundaries: bytes | None = None
+) -> int | None:
     """
     Simplified fuzzy matching returning only the score.
 
     Slightly faster than fuzzy_match() when positions aren't needed.
     Returns None if no match, otherwise the match score.
+
+    ``boundaries`` may be word_boundaries(target), cached by callers that
+    score the same target repeatedly.
     """
     if not query:
         return 0
@@ -133,34 +165,295 @@ def fuzzy_score(query: str, target: str) -> int | None:
     prev_match_idx = -1
 
     for query_idx, query_char in enumerate(query_lower):
-        found = False
-        while target_idx < target_len:
-            if target_lower[target_idx] == query_char:
-                if query_idx == 0 and target_idx == 0:
-                    score += SCORE_FIRST_CHAR
-
-                if _is_word_boundary(target, target_idx):
-                    score += SCORE_WORD_BOUNDARY
-
-                if prev_match_idx >= 0:
-                    gap = target_idx - prev_match_idx - 1
-                    if gap == 0:
-                        score += SCORE_CONSECUTIVE
-                    else:
-                        score += gap * SCORE_GAP_PENALTY
-
-                prev_match_idx = target_idx
-                target_idx += 1
-                found = True
-                break
-            target_idx += 1
-
-        if not found:
+        target_idx = target_lower.find(query_char, target_idx, target_len)
+        if target_idx == -1:
             return None
 
+        if query_idx == 0 and target_idx == 0:
+            score += SCORE_FIRST_CHAR
+
+        if boundaries is not None:
+            if boundaries[target_idx]:
+                score += SCORE_WORD_BOUNDARY
+        elif _is_word_boundary(target, target_idx):
+            score += SCORE_WORD_BOUNDARY
+
+        if prev_match_idx >= 0:
+            gap = target_idx - prev_match_idx - 1
+            if gap == 0:
+                score += SCORE_CONSECUTIVE
+            else:
+                score += gap * SCORE_GAP_PENALTY
+
+        prev_match_idx = target_idx
+        target_idx += 1
+
     return score
 
 
+@cache
+def _native_module() -> ModuleType | None:
+    """Return the numba kernels module, or None if numba isn't installed."""
+    try:
+        from dictation import fuzzy_native
+    except ImportError:
+        return None
+    return fuzzy_native
+
+
+def _ascii_lower(text: NDArray[np.uint8]) -> NDArray[np.uint8]:
+    """Lowercase ASCII bytes branchlessly, by OR-ing 0x20 into A-Z only."""
+    is_upper = (text >= ord("A")) & (text <= ord("Z"))
+    return text | (is_upper.view(np.uint8) << np.uint8(5))
+
+
+def _word_boundary_flags(
+    text: NDArray[np.uint8], lowered: NDArray[np.uint8], offsets: NDArray[np.int32]
+) -> NDArray[np.uint8]:
+    """Flag each byte of concatenated ASCII strings that starts a word.
+
+    Vectorised equivalent of _is_word_boundary over every position, where
+    ``lowered`` is ``_ascii_lower(text)`` and ``offsets`` marks where each
+    string starts.
+    """
+    prev = np.zeros_like(text)
+    prev[1:] = text[:-1]
+    flags = np.isin(prev, _WORD_BOUNDARY_BYTES)
+    # CamelCase: lowercase followed by uppercase (which lowering changed)
+    flags |= (prev >= ord("a")) & (prev <= ord("z")) & (text != lowered)
+    starts = offsets[:-1]
+    flags[starts[starts < len(text)]] = True
+    return flags.view(np.uint8)
+
+
+def _char_masks(text: NDArray[np.uint8]) -> NDArray[np.uint64]:
+    """Return the 128-bit set of ASCII characters in text, as two uint64s."""
+    bits = np.left_shift(np.uint64(1), (text & 63).astype(np.uint64))
+    high = text >= 64
+    return np.array(
+        [
+            np.bitwise_or.reduce(bits[~high], initial=np.uint64(0)),
+            np.bitwise_or.reduce(bits[high], initial=np.uint64(0)),
+        ],
+        dtype=np.uint64,
+    )
+
+
+def _candidate_char_masks(
+    paths_buf: NDArray[np.uint8], offsets: NDArray[np.int32]
+) -> NDArray[np.uint64]:
+    """Return an (N, 2) array of _char_masks for each candidate span."""
+    masks = np.zeros((len(offsets) - 1, 2), dtype=np.uint64)
+    starts = offsets[:-1]
+    nonempty = np.flatnonzero(offsets[1:] > starts)
+    if len(nonempty) == 0:
+        return masks
+
+    bits = np.left_shift(np.uint64(1), (paths_buf & 63).astype(np.uint64))
+    high = paths_buf >= 64
+    zero = np.uint64(0)
+    # reduceat ORs each span; empty spans are skipped as it mishandles them
+    for word, in_word in enumerate((~high, high)):
+        masks[nonempty, word] = np.bitwise_or.reduceat(
+            np.where(in_word, bits, zero), starts[nonempty]
+        )
+    return masks
+
+
+class CandidateSet:
+    """
+    Struct-of-arrays index of strings for repeated fuzzy ranking.
+
+    Everything the scorer needs per character is prepared once: the strings
+    lowercased and concatenated into one uint8 buffer, CSR-style offsets
+    into it, and a word-boundary flag per byte (taken from the original
+    case, for camelCase). A query is then scored in a single pass over the
+    buffer by the numba kernel, with no per-item Python dispatch.
+
+    Non-ASCII strings keep an empty span and are scored in Python, as is
+    everything when numba isn't installed or the query isn't ASCII.
+    """
+
+    def __init__(self, strings: Sequence[str]) -> None:
+        self.strings: list[str] = list(strings)
+        self.is_ascii: NDArray[np.bool_] = np.fromiter(
+            (s.isascii() for s in self.strings), dtype=np.bool_, count=len(self.strings)
+        )
+        self.lengths: NDArray[np.int32] = np.fromiter(
+            map(len, self.strings), dtype=np.int32, count=len(self.strings)
+        )
+        self._all = np.arange(len(self.strings), dtype=np.intp)
+        encoded = [s.encode("ascii") if s.isascii() else b"" for s in self.strings]
+
+        self.offsets: NDArray[np.int32] = np.zeros(len(encoded) + 1, dtype=np.int32)
+        np.cumsum([len(b) for b in encoded], out=self.offsets[1:])
+
+        text = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        self.paths_buf: NDArray[np.uint8] = _ascii_lower(text)
+        self.wb_flags: NDArray[np.uint8] = _word_boundary_flags(
+            text, self.paths_buf, self.offsets
+        )
+        # Characters present in each candidate, as a prefilter; non-ASCII
+        # candidates have no span to summarise, so they always pass
+        self.char_masks: NDArray[np.uint64] = _candidate_char_masks(
+            self.paths_buf, self.offsets
+        )
+        self.char_masks[~self.is_ascii] = np.iinfo(np.uint64).max
+
+    def __len__(self) -> int:
+        """Return the number of candidates."""
+        return len(self.strings)
+
+    @cached_property
+    def boundaries(self) -> list[bytes]:
+        """Per-candidate word-boundary bitmaps for the pure-Python scorer.
+
+        Built on first use: with numba and ASCII queries they aren't needed.
+        ASCII candidates are sliced out of ``wb_flags``.
+        """
+        flags = self.wb_flags.tobytes()
+        offsets = self.offsets.tolist()
+        return [
+            flags[offsets[i] : offsets[i + 1]] if s.isascii() else word_boundaries(s)
+            for i, s in enumerate(self.strings)
+        ]
+
+    def _python_score(self, query: str, index: int) -> int:
+        """Score one candidate with fuzzy_score, using its cached bitmap."""
+        score = fuzzy_score(query, self.strings[index], self.boundaries[index])
+        return NO_MATCH if score is None else score
+
+    def scores(
+        self, query: str, indices: NDArray[np.intp] | None = None
+    ) -> NDArray[np.int32]:
+        """
+        Score candidates, with NO_MATCH where the query doesn't match.
+
+        Scores every candidate, or only ``indices`` (aligned with them).
+        """
+        if indices is None:
+            indices = self._all
+
+        native = _native_module()
+        if native is None or not query.isascii():
+            return np.array(
+                [self._python_score(query, i) for i in indices.tolist()],
+                dtype=np.int32,
+            )
+
+        query_lower = _ascii_lower(np.frombuffer(query.encode("ascii"), dtype=np.uint8))
+        scores = native.score_candidates(
+            query_lower, self.paths_buf, self.offsets, self.wb_flags, indices
+        )
+        for j in np.flatnonzero(~self.is_ascii[indices]).tolist():
+            scores[j] = self._python_score(query, int(indices[j]))
+        return scores
+
+    def matches(
+        self,
+        query: str,
+        within: NDArray[np.intp] | None = None,
+        python_limit: int | None = None,
+    ) -> tuple[NDArray[np.intp], NDArray[np.int32], bool]:
+        """
+        Return the indices of the candidates matching query, their scores,
+        and whether every match was found.
+
+        ``within`` restricts the search to those indices, typically the
+        matches of a shorter query that this one extends: a string that
+        doesn't contain "ab" as a subsequence can't contain "abc" either.
+        Only a complete result can be reused that way; MAX_LENGTH_RATIO
+        drops candidates that a longer query may still match.
+
+        When scoring falls back to Python, ``python_limit`` stops the search
+        after that many matches, in candidate order.
+        """
+        indices = self._all if within is None else within
+        # A query can't match a shorter candidate, so don't score those
+        lengths = self.lengths[indices]
+        keep = lengths >= len(query)
+        # ...or one that lacks any of its characters
+        if query.isascii():
+            query_mask = _char_masks(
+                _ascii_lower(np.frombuffer(query.encode("ascii"), dtype=np.uint8))
+            )
+            masks = self.char_masks if within is None else self.char_masks[indices]
+            for word in (0, 1):
+                keep &= (masks[:, word] & query_mask[word]) == query_mask[word]
+        # Capping length can drop real matches, which leaves the result partial
+        complete = True
+        if MAX_LENGTH_RATIO is not None:
+            short_enough = lengths <= MAX_LENGTH_RATIO * len(query)
+            complete = bool(short_enough[keep].all())
+            keep &= short_enough
+        indices = indices[keep]
+
+        native = _native_module() is not None and query.isascii()
+        if python_limit is not None and not native:
+            found: list[int] = []
+            found_scores: list[int] = []
+            candidates = indices.tolist()
+            for position, i in enumerate(candidates):
+                score = self._python_score(query, i)
+                if score == NO_MATCH:
+                    continue
+                found.append(i)
+                found_scores.append(score)
+                if len(found) >= python_limit:
+                    complete = complete and position == len(candidates) - 1
+                    break
+            return (
+                np.array(found, dtype=np.intp),
+                np.array(found_scores, dtype=np.int32),
+                complete,
+            )
+
+        scores = self.scores(query, indices)
+        matched = scores != NO_MATCH
+        return indices[matched], scores[matched], complete
+
+    def best(
+        self, indices: NDArray[np.intp], scores: NDArray[np.int32], limit: int = 50
+    ) -> list[tuple[int, int]]:
+        """
+        Return (index, score) pairs for the best of matches(), best first.
+
+        Ordered by score descending, then by string for ties - the same as
+        fully sorting every match - but only the top ``limit`` are sorted.
+        """
+        if limit <= 0:
+            return []
+
+        cutoff = 0
+        tied: list[int] = []
+        if len(indices) > limit:
+            # The limit-th best score, by selection rather than sorting
+            kth = len(scores) - limit
+            cutoff = int(np.partition(scores, kth)[kth])
+            # Candidates tied with the limit-th best compete on string order
+            tied = indices[scores == cutoff].tolist()
+            above = scores > cutoff
+            indices, scores = indices[above], scores[above]
+
+        # Decorate-sort-undecorate: plain tuple comparisons, no key callback.
+        # The index breaks exact ties the way a stable sort would.
+        strings = self.strings
+        decorated = sorted(
+            (-score, strings[i], i)
+            for i, score in zip(indices.tolist(), scores.tolist(), strict=True)
+        )
+        ranked = [(i, -neg_score) for neg_score, _string, i in decorated]
+        # Only the tied group can be large; nsmallest keys each item once
+        at_cutoff = heapq.nsmallest(limit - len(ranked), tied, key=strings.__getitem__)
+        ranked += [(i, cutoff) for i in at_cutoff]
+        return ranked
+
+    def rank(self, query: str, limit: int = 50) -> list[tuple[int, int]]:
+        """Return (index, score) pairs for the best matches, best first."""
+        indices, scores, _complete = self.matches(query)
+        return self.best(indices, scores, limit)
+
+
 def rank_matches[T](
     query: str,
     items: Sequence[T],
@@ -184,30 +477,6 @@ def rank_matches[T](
         # Return first `limit` items with score 0 if no query
         return [(item, 0) for item in items[:limit]]
 
-    scored: list[tuple[T, int]] = []
-
-    for item in items:
-        target = key(item)
-        score = fuzzy_score(query, target)
-        if score is not None:
-            scored.append((item, score))
-
-    # Sort by score descending, then by key alphabetically for ties
-    scored.sort(key=lambda x: (-x[1], key(x[0])))
-
-    return scored[:limit]
+    candidates = CandidateSet([key(item) for item in items])
+    return [(items[i], score) for i, score in candidates.rank(query, limit)]
 
-
-def build_sql_pattern(query: str) -> str:
-    """
-    Build a SQL LIKE pattern for pre-filtering candidates.
-
-    Converts query "abc" to "%a%b%c%" to ensure the subsequence
-    exists in the database before applying full fuzzy scoring.
-    """
-    if not query:
-        return "%"
-    # Escape SQL LIKE special characters
-    escaped = query.replace("%", r"\%").replace("_", r"\_")
-    # Build pattern with wildcards between each character
-    return "%" + "%".join(escaped.lower()) + "%"
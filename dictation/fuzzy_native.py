@@ -0,0 +1,146 @@
+"""Numba-compiled fuzzy scoring kernels.
+
+Native counterparts of the scorers in ``dictation.fuzzy``, operating on the
+struct-of-arrays buffers of a ``CandidateSet`` so the inner loop is plain
+integer arithmetic. Importing this module requires numba (the ``native``
+extra); ``dictation.fuzzy`` falls back to its pure-Python implementation
+when it is unavailable.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import numpy as np
+from numba import config, get_num_threads, njit, prange
+
+from dictation.fuzzy import (
+    NO_MATCH,
+    SCORE_CONSECUTIVE,
+    SCORE_FIRST_CHAR,
+    SCORE_GAP_PENALTY,
+    SCORE_WORD_BOUNDARY,
+)
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+# Note searches run these kernels on a worker thread, and once the TBB
+# threading layer has been launched off the main thread the interpreter
+# hangs at exit; prefer the other layers unless the user chose a layer or a
+# priority. numba sets its config attributes dynamically, hence getattr/setattr.
+if (
+    getattr(config, "THREADING_LAYER", "default") == "default"
+    and "NUMBA_THREADING_LAYER_PRIORITY" not in os.environ
+):
+    setattr(config, "THREADING_LAYER_PRIORITY", ["omp", "workqueue", "tbb"])
+
+# Below this many candidates, thread start-up costs more than it saves
+PARALLEL_MIN_CANDIDATES = 4096
+
+
+@njit(cache=True, inline="always", boundscheck=False)
+def _score_span(
+    query_lower: NDArray[np.uint8],
+    paths_buf: NDArray[np.uint8],
+    wb_flags: NDArray[np.uint8],
+    start: int,
+    end: int,
+) -> int:
+    """Score one candidate, ``paths_buf[start:end]``, like ``fuzzy_score``."""
+    query_len = query_lower.shape[0]
+    if query_len == 0:
+        return 0
+    if query_len > end - start:
+        return NO_MATCH
+
+    score = 0
+    target_idx = start
+    prev_match_idx = -1
+
+    for query_idx in range(query_len):
+        query_char = query_lower[query_idx]
+        found = False
+        while target_idx < end:
+            if paths_buf[target_idx] == query_char:
+                if query_idx == 0 and target_idx == start:
+                    score += SCORE_FIRST_CHAR
+
+                if wb_flags[target_idx]:
+                    score += SCORE_WORD_BOUNDARY
+
+                if prev_match_idx >= 0:
+                    gap = target_idx - prev_match_idx - 1
+                    if gap == 0:
+                        score += SCORE_CONSECUTIVE
+                    else:
+                        score += gap * SCORE_GAP_PENALTY
+
+                prev_match_idx = target_idx
+                target_idx += 1
+                found = True
+                break
+            target_idx += 1
+
+        if not found:
+            return NO_MATCH
+
+    return score
+
+
+@njit(cache=True, boundscheck=False)
+def _score_candidates_serial(
+    query_lower: NDArray[np.uint8],
+    paths_buf: NDArray[np.uint8],
+    offsets: NDArray[np.int32],
+    wb_flags: NDArray[np.uint8],
+    indices: NDArray[np.intp],
+) -> NDArray[np.int32]:
+    """Score candidates on the calling thread (see score_candidates)."""
+    scores = np.empty(indices.shape[0], dtype=np.int32)
+    for j in range(indices.shape[0]):
+        i = indices[j]
+        scores[j] = _score_span(
+            query_lower, paths_buf, wb_flags, int(offsets[i]), int(offsets[i + 1])
+        )
+    return scores
+
+
+@njit(cache=True, parallel=True, boundscheck=False)
+def _score_candidates_parallel(
+    query_lower: NDArray[np.uint8],
+    paths_buf: NDArray[np.uint8],
+    offsets: NDArray[np.int32],
+    wb_flags: NDArray[np.uint8],
+    indices: NDArray[np.intp],
+) -> NDArray[np.int32]:
+    """Score candidates across all cores (see score_candidates)."""
+    scores = np.empty(indices.shape[0], dtype=np.int32)
+    for j in prange(indices.shape[0]):
+        i = indices[j]
+        scores[j] = _score_span(
+            query_lower, paths_buf, wb_flags, int(offsets[i]), int(offsets[i + 1])
+        )
+    return scores
+
+
+def score_candidates(
+    query_lower: NDArray[np.uint8],
+    paths_buf: NDArray[np.uint8],
+    offsets: NDArray[np.int32],
+    wb_flags: NDArray[np.uint8],
+    indices: NDArray[np.intp],
+) -> NDArray[np.int32]:
+    """
+    Score the candidates at ``indices`` against a lowercased ASCII query.
+
+    Candidate ``i`` is ``paths_buf[offsets[i]:offsets[i + 1]]``. Returns
+    one score per index, NO_MATCH where the query doesn't match. Large
+    sets are split across cores; small ones aren't worth waking threads.
+    """
+    if indices.shape[0] >= PARALLEL_MIN_CANDIDATES and get_num_threads() > 1:
+        kernel = _score_candidates_parallel
+    else:
+        kernel = _score_candidates_serial
+    return kernel(query_lower, paths_buf, offsets, wb_flags, indices)
@@ -4,23 +4,35 @@ from __future__ import annotations
 
 import os
 import socket
-from pathlib import Path
 from typing import TYPE_CHECKING
 
 from PySide6.QtCore import QObject, QSocketNotifier, Signal
 
 if TYPE_CHECKING:
-    pass
+    from PySide6.QtCore import SignalInstance
 
 
-def get_socket_path() -> Path:
-    """Get the socket path for IPC communication."""
-    uid = os.getuid()
-    return Path(f"/tmp/dictation-{uid}.sock")
+# Upper bound on datagrams handled per wake-up, so a flood can't stall the UI
+MAX_COMMANDS_PER_WAKEUP = 32
+
+# Resolved once; the uid can't change for the life of the process
+_SOCKET_PATH = f"/tmp/dictation-{os.getuid()}.sock"
+
+
+def _remove_socket_file() -> None:
+    """Remove the socket file if present."""
+    try:
+        os.unlink(_SOCKET_PATH)
+    except FileNotFoundError:
+        pass
 
 
 class IPCServer(QObject):
-    """Unix domain socket server for IPC commands."""
+    """Unix domain datagram socket server for IPC commands.
+
+    Each command is a single datagram, so there is no connection to accept
+    and a slow client cannot hold up the server.
+    """
 
     toggle_requested = Signal()
     show_requested = Signal()
@@ -32,27 +44,32 @@ class IPCServer(QObject):
         self._socket: socket.socket | None = None
         self._notifier: QSocketNotifier | None = None
 
+        # Raw (upper-cased) command bytes -> signal to emit
+        self._commands: dict[bytes, SignalInstance] = {
+            b"TOGGLE": self.toggle_requested,
+            b"SHOW": self.show_requested,
+            b"HIDE": self.hide_requested,
+            b"QUIT": self.quit_requested,
+            b"STOP": self.quit_requested,
+        }
+
     def start(self) -> bool:
         """Start the IPC server. Returns True on success."""
-        socket_path = get_socket_path()
-
         # Remove existing socket if present
-        if socket_path.exists():
-            socket_path.unlink()
+        _remove_socket_file()
 
         try:
-            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
             self._socket.setblocking(False)
-            self._socket.bind(str(socket_path))
-            self._socket.listen(5)
+            self._socket.bind(_SOCKET_PATH)
 
-            # Set up Qt notification for incoming connections
+            # Set up Qt notification for incoming datagrams
             self._notifier = QSocketNotifier(
                 self._socket.fileno(),
                 QSocketNotifier.Type.Read,
                 self,
             )
-            self._notifier.activated.connect(self._handle_connection)
+            self._notifier.activated.connect(self._handle_datagrams)
 
             return True
         except OSError as e:
@@ -69,52 +86,39 @@ class IPCServer(QObject):
             self._socket.close()
             self._socket = None
 
-        socket_path = get_socket_path()
-        if socket_path.exists():
-            socket_path.unlink()
+        _remove_socket_file()
 
-    def _handle_connection(self) -> None:
-        """Handle an incoming connection."""
+    def _handle_datagrams(self) -> None:
+        """Handle all queued command datagrams in one notifier wake-up."""
         if self._socket is None:
             return
 
-        try:
-            conn, _ = self._socket.accept()
-            with conn:
-                conn.settimeout(1.0)
-                data = conn.recv(64).decode("utf-8").strip()
-                self._process_command(data)
-                conn.sendall(b"OK\n")
-        except (OSError, TimeoutError):
-            pass
-
-    def _process_command(self, command: str) -> None:
-        """Process a received command."""
-        cmd = command.upper()
-        if cmd == "TOGGLE":
-            self.toggle_requested.emit()
-        elif cmd == "SHOW":
-            self.show_requested.emit()
-        elif cmd == "HIDE":
-            self.hide_requested.emit()
-        elif cmd == "QUIT" or cmd == "STOP":
-            self.quit_requested.emit()
+        for _ in range(MAX_COMMANDS_PER_WAKEUP):
+            try:
+                data = self._socket.recv(64)
+            except OSError:  # BlockingIOError once the queue is empty
+                return
+            self._process_command(data)
 
+    def _process_command(self, command: bytes) -> None:
+        """Process a received command without decoding it."""
+        signal = self._commands.get(command.strip().upper())
+        if signal is not None:
+            signal.emit()
 
-def send_command(command: str, timeout: float = 1.0) -> bool:
-    """Send a command to the dictation server. Returns True on success."""
-    socket_path = get_socket_path()
 
-    if not socket_path.exists():
-        return False
+def send_command(command: str, timeout: float = 1.0) -> bool:
+    """Send a command to the dictation server. Returns True on success.
 
+    Fire-and-forget: success means the datagram was delivered to the
+    server's socket; no acknowledgement is waited for.
+    """
+    # A missing socket file fails sendto() with ENOENT, so no separate check
     try:
-        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
             sock.settimeout(timeout)
-            sock.connect(str(socket_path))
-            sock.sendall(f"{command}\n".encode("utf-8"))
-            response = sock.recv(64).decode("utf-8").strip()
-            return response == "OK"
+            sock.sendto(f"{command}\n".encode("utf-8"), _SOCKET_PATH)
+            return True
     except (OSError, TimeoutError):
         return False
 
@@ -140,5 +144,5 @@ def send_stop() -> bool:
 
 
 def is_server_running() -> bool:
-    """Check if the dictation server is running."""
+    """Check if the dictation server is running (its socket accepts a datagram)."""
     return send_command("PING")
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import sqlite3
+import sys
 from dataclasses import dataclass
 from enum import IntEnum
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from PySide6.QtCore import (
     QAbstractListModel,
@@ -14,11 +15,31 @@ from PySide6.QtCore import (
     QModelIndex,
     QObject,
     QPersistentModelIndex,
+    QRunnable,
     Qt,
+    QThreadPool,
+    QTimer,
     Signal,
     Slot,
 )
 
+from dictation.fuzzy import CandidateSet
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+# Maximum number of results shown by NoteSearchModel
+SEARCH_LIMIT = 50
+SEARCH_DEBOUNCE_MS = 60  # Wait for typing to pause before searching
+# Without numba, only the first matches in path order are ranked
+PYTHON_MATCH_LIMIT = 500
+
+# Note paths: a trigger-maintained table if the database has one, else the
+# recursive view it materialises
+PATH_TABLE = "t_note_id_path_mapping"
+PATH_VIEW = "v_note_id_path_mapping"
+
 
 @dataclass(frozen=True, slots=True)
 class NoteResult:
@@ -57,64 +78,187 @@ class NoteRole(IntEnum):
     OrgLink = Qt.ItemDataRole.UserRole + 5
 
 
-def search_notes(
-    db_path: Path, query: str, limit: int = 50, candidate_limit: int = 500
-) -> list[NoteResult]:
-    """Search notes by path using fuzzy matching.
+def _path_source(conn: sqlite3.Connection) -> str:
+    """Return the table or view to read note paths from."""
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+        (PATH_TABLE,),
+    ).fetchone()
+    return PATH_TABLE if row is not None else PATH_VIEW
+
+
+def connect(db_path: Path) -> sqlite3.Connection:
+    """Open a long-lived, read-only connection for searching notes.
+
+    Tuned for repeated reads. Not bound to the opening thread, but only use
+    it from one thread at a time.
+    """
+    conn = sqlite3.connect(
+        f"{db_path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False
+    )
+    conn.execute("PRAGMA query_only = ON")
+    conn.execute("PRAGMA mmap_size = 268435456")  # 256MB
+    conn.execute("PRAGMA cache_size = -65536")  # 64MB
+    conn.execute("PRAGMA temp_store = MEMORY")
+    return conn
+
+
+def _note_rows(conn: sqlite3.Connection) -> sqlite3.Cursor:
+    """Return a cursor over every note's (id, title, full_path) row."""
+    relation = _path_source(conn)
+    # Notes in a missing folder have no path in the view
+    return conn.execute(
+        f"SELECT id, title, full_path FROM {relation} WHERE full_path IS NOT NULL"
+        " ORDER BY full_path"
+    )
+
+
+def _role_values(results: list[NoteResult]) -> dict[int, list[str]]:
+    """Compute every model role's value for each result, keyed by role."""
+    full_paths = [result.full_path for result in results]
+    return {
+        Qt.ItemDataRole.DisplayRole: full_paths,
+        NoteRole.FullPath: full_paths,
+        NoteRole.Id: [result.id for result in results],
+        NoteRole.Title: [result.title for result in results],
+        NoteRole.MarkdownLink: [result.to_markdown_link() for result in results],
+        NoteRole.OrgLink: [result.to_org_link() for result in results],
+    }
 
-    Uses a two-phase approach for performance:
-    1. SQL pre-filter with subsequence pattern to reduce candidates
-    2. Python fuzzy scoring to rank and sort results
+
+class NoteIndex:
+    """In-memory fuzzy search index over the notes in a database.
+
+    All note paths are loaded into a CandidateSet on the first search, and
+    again whenever another connection changes the database, so each search
+    is a single in-memory scoring pass rather than a database query. When a
+    query extends the previous one, only the previous matches are rescored.
+    Without numba, a search ranks at most PYTHON_MATCH_LIMIT matches.
+
+    Not thread-safe: use from one thread at a time.
     """
-    from dictation.fuzzy import build_sql_pattern, rank_matches
-
-    if not query.strip():
-        return []
-
-    conn = sqlite3.connect(db_path)
-    try:
-        cursor = conn.cursor()
-        # Phase 1: SQL pre-filter with subsequence pattern
-        search_pattern = build_sql_pattern(query)
-        cursor.execute(
-            """
-            SELECT id, title, full_path
-            FROM v_note_id_path_mapping
-            WHERE LOWER(full_path) LIKE ? ESCAPE '\\'
-            ORDER BY full_path
-            LIMIT ?
-            """,
-            (search_pattern, candidate_limit),
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self._conn = conn
+        # Raw (id, title, full_path) rows; only results become NoteResults
+        self._rows: list[tuple[str, str, str]] = []
+        self._candidates: CandidateSet = CandidateSet([])
+        self._data_version: int | None = None
+        self._last_query: str = ""  # Lowercased
+        self._last_matches: NDArray[np.intp] | None = None
+
+    def search(self, query: str, limit: int = SEARCH_LIMIT) -> list[NoteResult]:
+        """Return the best ``limit`` notes for the query, best first."""
+        if not query.strip():
+            self._last_matches = None
+            return []
+
+        self._refresh()
+        query_lower = query.lower()
+        within = None
+        if self._last_matches is not None and query_lower.startswith(
+            self._last_query
+        ):
+            within = self._last_matches
+
+        indices, scores, complete = self._candidates.matches(
+            query, within, python_limit=PYTHON_MATCH_LIMIT
         )
-        candidates = [
-            NoteResult(id=row[0], title=row[1], full_path=row[2])
-            for row in cursor.fetchall()
+        self._last_query = query_lower
+        self._last_matches = indices if complete else None
+        ranked = self._candidates.best(indices, scores, limit)
+        rows = self._rows
+        return [
+            NoteResult(id=rows[i][0], title=rows[i][1], full_path=rows[i][2])
+            for i, _score in ranked
         ]
-    finally:
-        conn.close()
-
-    # Phase 2: Fuzzy scoring and ranking
-    ranked = rank_matches(
-        query=query,
-        items=candidates,
-        key=lambda note: note.full_path,
-        limit=limit,
-    )
 
-    return [note for note, _score in ranked]
+    def _refresh(self) -> None:
+        """(Re)load the notes if the database changed since the last load."""
+        # Changes whenever another connection commits to the database
+        (data_version,) = self._conn.execute("PRAGMA data_version").fetchone()
+        if data_version == self._data_version:
+            return
+        self._rows = _note_rows(self._conn).fetchall()
+        self._candidates = CandidateSet([row[2] for row in self._rows])
+        self._data_version = data_version
+        self._last_matches = None
+
+
+class SearchTask(QRunnable):
+    """Runs one NoteIndex search on a thread pool."""
+
+    class Signals(QObject):
+        """QRunnable isn't a QObject, so its signals live here."""
+
+        finished = Signal(int, object)  # Generation, list[NoteResult]
+
+    def __init__(
+        self, index: NoteIndex, query: str, generation: int, signals: Signals
+    ) -> None:
+        super().__init__()
+        self._index = index
+        self._query = query
+        self._generation = generation
+        self._signals = signals
+
+    def run(self) -> None:
+        """Search and report the results - called on a pool thread."""
+        try:
+            results = self._index.search(self._query)
+        except Exception as e:
+            print(f"Warning: Note search failed: {e}", file=sys.stderr)
+            return
+        self._signals.finished.emit(self._generation, results)
 
 
 class NoteSearchModel(QAbstractListModel):
-    """Qt model for note search results."""
+    """Qt model for note search results.
+
+    The database stays open for the model's lifetime. Searches run on a
+    background thread, debounced so a burst of keystrokes only searches
+    for the last one. Results from searches that were superseded before
+    finishing are dropped.
+    """
 
     def __init__(self, parent: QObject | None = None) -> None:
         super().__init__(parent)
         self._results: list[NoteResult] = []
-        self._db_path: Path | None = None
+        # Per-role values for each result row, built once per search
+        self._role_values: dict[int, list[str]] = {}
+        self._conn: sqlite3.Connection | None = None
+        self._index: NoteIndex | None = None
+        self._query: str = ""
+        self._generation: int = 0  # Bumped per search; stale results are dropped
+
+        # One thread, so a NoteIndex is never searched concurrently
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._search_signals = SearchTask.Signals(self)
+        self._search_signals.finished.connect(self._on_search_finished)
+
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._debounce_timer.timeout.connect(self._start_search)
 
     def set_db_path(self, path: Path) -> None:
-        """Set the database path for searches."""
-        self._db_path = path
+        """Open the database to search, closing any previous one."""
+        self.close()
+        self._conn = connect(path)
+        self._index = NoteIndex(self._conn)
+
+    def close(self) -> None:
+        """Stop searching and close the database connection."""
+        self._debounce_timer.stop()
+        self._generation += 1
+        # A running search may still be using the connection
+        self._pool.clear()
+        self._pool.waitForDone()
+        self._index = None
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
 
     def rowCount(
         self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()
@@ -133,20 +277,10 @@ class NoteSearchModel(QAbstractListModel):
         if not index.isValid() or index.row() >= len(self._results):
             return None
 
-        result = self._results[index.row()]
-
-        if role == Qt.ItemDataRole.DisplayRole or role == NoteRole.FullPath:
-            return result.full_path
-        if role == NoteRole.Id:
-            return result.id
-        if role == NoteRole.Title:
-            return result.title
-        if role == NoteRole.MarkdownLink:
-            return result.to_markdown_link()
-        if role == NoteRole.OrgLink:
-            return result.to_org_link()
-
-        return None
+        values = self._role_values.get(role)
+        if values is None:
+            return None
+        return values[index.row()]
 
     def roleNames(self) -> dict[int, QByteArray]:
         """Return role names for QML access."""
@@ -160,26 +294,46 @@ class NoteSearchModel(QAbstractListModel):
 
     @Slot(str)
     def search(self, query: str) -> None:
-        """Perform a search and update results."""
-        if self._db_path is None:
+        """Search for the query once typing pauses, updating results."""
+        if self._index is None:
+            return
+
+        self._query = query
+        self._generation += 1
+        self._debounce_timer.start()
+
+    def _start_search(self) -> None:
+        """Queue the pending query, dropping any search not yet started."""
+        if self._index is None:
+            return
+
+        self._pool.clear()
+        self._pool.start(
+            SearchTask(self._index, self._query, self._generation, self._search_signals)
+        )
+
+    def _on_search_finished(self, generation: int, results: list[NoteResult]) -> None:
+        """Show results, unless a newer search has been requested since."""
+        if generation != self._generation:
             return
 
         self.beginResetModel()
-        self._results = search_notes(self._db_path, query)
+        self._results = results
+        self._role_values = _role_values(results)
         self.endResetModel()
 
     @Slot(int, result=str)
     def getMarkdownLink(self, row: int) -> str:
         """Get the markdown link for a specific row."""
         if 0 <= row < len(self._results):
-            return self._results[row].to_markdown_link()
+            return self._role_values[NoteRole.MarkdownLink][row]
         return ""
 
     @Slot(int, result=str)
     def getOrgLink(self, row: int) -> str:
         """Get the org-mode link for a specific row."""
         if 0 <= row < len(self._results):
-            return self._results[row].to_org_link()
+            return self._role_values[NoteRole.OrgLink][row]
         return ""
 
     resultCountChanged = Signal()
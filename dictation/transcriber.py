@@ -3,154 +3,206 @@
 from __future__ import annotations
 
 import os
-from pathlib import Path
+import sys
+import time
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
+import ctranslate2
+import numpy as np
 from faster_whisper import WhisperModel
-from PySide6.QtCore import QObject, QThread, Signal
+from PySide6.QtCore import QObject, Qt, QThread, Signal, Slot
+
+from dictation.audio import SAMPLE_RATE, clip_to_full_scale, warm_up_filter
 
 if TYPE_CHECKING:
-    pass
+    from collections.abc import Iterable, Iterator
+
+    from faster_whisper.transcribe import Segment
+    from numpy.typing import NDArray
 
 # Model configuration
 DEFAULT_MODEL_SIZE = os.environ.get("DICTATION_MODEL", "base")
-DEFAULT_DEVICE = "auto"  # auto, cpu, cuda
-DEFAULT_COMPUTE_TYPE = "int8"  # int8, float16, float32
+DEFAULT_DEVICE = os.environ.get("DICTATION_DEVICE", "auto")  # auto, cpu, cuda
+# Empty means pick per device: int8 weights, fp16 activations on CUDA
+DEFAULT_COMPUTE_TYPE = os.environ.get("DICTATION_COMPUTE_TYPE", "")
+CPU_COMPUTE_TYPE = "int8"
+CUDA_COMPUTE_TYPE = "int8_float16"
 
-# Module-level model cache (persists for app lifetime)
-_cached_model: WhisperModel | None = None
-_cached_model_size: str | None = None
+# Decoding configuration
+BEAM_SIZE = 5
+# Clips shorter than this are push-to-talk snippets that are almost all
+# speech: skip VAD and decode greedily, where both cost more than they gain
+SHORT_CLIP_SECONDS = 2.0
+VAD_PARAMETERS = {"threshold": 0.5, "min_silence_duration_ms": 500}
 
+# Progress reporting while segments are decoded
+PROGRESS_INTERVAL_SECONDS = 0.25  # Throttle to keep QML re-binding cheap
+PROGRESS_TEXT_CHARS = 60  # Tail of the running transcript to show
 
-def get_model(model_size: str) -> WhisperModel:
-    """Get or create the Whisper model (cached at module level)."""
-    global _cached_model, _cached_model_size
 
-    if _cached_model is None or _cached_model_size != model_size:
-        _cached_model = WhisperModel(
-            model_size,
-            device=DEFAULT_DEVICE,
-            compute_type=DEFAULT_COMPUTE_TYPE,
-        )
-        _cached_model_size = model_size
+def select_device() -> tuple[str, str]:
+    """Resolve the (device, compute_type) pair to load the model with."""
+    device = DEFAULT_DEVICE
+    if device == "auto":
+        device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+
+    compute_type = DEFAULT_COMPUTE_TYPE
+    if not compute_type:
+        compute_type = CUDA_COMPUTE_TYPE if device == "cuda" else CPU_COMPUTE_TYPE
+
+    return device, compute_type
 
-    return _cached_model
+
+# Models are hundreds of MB to GBs, so only keep the most recent one loaded
+@lru_cache(maxsize=1)
+def get_model(model_size: str) -> WhisperModel:
+    """Get or create the Whisper model (cached for the app lifetime)."""
+    device, compute_type = select_device()
+    return WhisperModel(
+        model_size,
+        device=device,
+        compute_type=compute_type,
+    )
+
+
+def warm_up_model(model_size: str = DEFAULT_MODEL_SIZE) -> None:
+    """Load the model and run one second of silence through it.
+
+    Intended to run on the worker thread at startup so the first dictation
+    doesn't pay for model loading and backend kernel initialisation.
+    """
+    model = get_model(model_size)
+    # VAD would strip pure silence, so disable it to actually run the decoder
+    segments, _info = model.transcribe(
+        np.zeros(SAMPLE_RATE, dtype=np.float32), beam_size=1, vad_filter=False
+    )
+    for _segment in segments:
+        pass
 
 
 class TranscriptionWorker(QObject):
-    """Worker that runs transcription in a separate thread."""
+    """Worker that runs transcription jobs on a long-lived thread."""
 
     finished = Signal(str)  # Emits transcribed text
     error = Signal(str)  # Emits error message
     progress = Signal(str)  # Emits progress updates
 
-    def __init__(self, parent: QObject | None = None) -> None:
-        super().__init__(parent)
-        self._audio_path: Path | None = None
-        self._model_size: str = DEFAULT_MODEL_SIZE
-
-    def set_audio_path(self, path: Path) -> None:
-        """Set the audio file to transcribe."""
-        self._audio_path = path
-
-    def set_model_size(self, size: str) -> None:
-        """Set the Whisper model size."""
-        self._model_size = size
-
-    def run(self) -> None:
-        """Perform transcription - called from worker thread."""
-        if self._audio_path is None:
-            self.error.emit("No audio file specified")
-            return
-
+    @Slot(object, str)
+    def transcribe(self, audio: NDArray[np.float32], model_size: str) -> None:
+        """Transcribe 16kHz mono float32 samples - called on the worker thread."""
         try:
+            # Finalise the recording here rather than on the GUI thread
+            clip_to_full_scale(audio)
+
             self.progress.emit("Loading model...")
 
             # Get cached model
-            model = get_model(self._model_size)
+            model = get_model(model_size)
 
             self.progress.emit("Transcribing...")
 
             # Transcribe
+            is_short = len(audio) < SHORT_CLIP_SECONDS * SAMPLE_RATE
             segments, info = model.transcribe(
-                str(self._audio_path),
-                beam_size=5,
-                vad_filter=True,  # Voice activity detection
+                audio,
+                beam_size=1 if is_short else BEAM_SIZE,
+                vad_filter=not is_short,  # Voice activity detection
+                vad_parameters=VAD_PARAMETERS,
             )
 
-            # Collect all text
-            text_parts = [segment.text for segment in segments]
-            full_text = " ".join(text_parts).strip()
-
-            # Clean up temp file
-            self._audio_path.unlink(missing_ok=True)
+            # Collect all text straight from the segment generator
+            texts = self._segment_texts(segments, info.duration)
+            full_text = " ".join(texts).strip()
 
             self.finished.emit(full_text)
 
         except Exception as e:
             self.error.emit(str(e))
 
+    def _segment_texts(
+        self, segments: Iterable[Segment], duration: float
+    ) -> Iterator[str]:
+        """Yield segment text, reporting progress as segments are decoded.
+
+        faster-whisper decodes lazily, so each segment arrives as soon as it
+        is ready and the UI can show how far through the audio we are.
+        """
+        tail = ""
+        last_report = 0.0
+        for segment in segments:
+            tail = (tail + segment.text)[-PROGRESS_TEXT_CHARS:]
+            now = time.monotonic()
+            if now - last_report >= PROGRESS_INTERVAL_SECONDS:
+                last_report = now
+                fraction = min(segment.end / duration, 1.0) if duration > 0 else 1.0
+                self.progress.emit(f"Transcribing... {fraction:.0%}\n{tail.strip()}")
+            yield segment.text
+
+    @Slot(str)
+    def warm_up(self, model_size: str) -> None:
+        """Preload the model and the audio filter - called on the worker thread."""
+        # Otherwise the first recording compiles the filter on the GUI thread
+        try:
+            warm_up_filter()
+        except Exception as e:
+            print(f"Warning: Failed to compile the audio filter: {e}", file=sys.stderr)
+        try:
+            warm_up_model(model_size)
+        except Exception as e:
+            print(f"Warning: Failed to preload Whisper model: {e}", file=sys.stderr)
+
 
 class Transcriber(QObject):
-    """Manages transcription with background threading."""
+    """Manages transcription on a persistent background thread.
+
+    Jobs are queued to the worker through signals, so there is no per-
+    utterance thread start-up and the model stays on a single thread.
+    """
 
     transcription_started = Signal()
     transcription_finished = Signal(str)  # Emits transcribed text
     transcription_error = Signal(str)
     transcription_progress = Signal(str)
 
+    # Job requests, delivered to the worker thread via queued connections
+    _transcribe_requested = Signal(object, str)
+    _warm_up_requested = Signal(str)
+
     def __init__(self, parent: QObject | None = None) -> None:
         super().__init__(parent)
-        self._thread: QThread | None = None
-        self._worker: TranscriptionWorker | None = None
         self._model_size: str = DEFAULT_MODEL_SIZE
 
-    def set_model_size(self, size: str) -> None:
-        """Set the Whisper model size."""
-        self._model_size = size
-
-    def transcribe(self, audio_path: Path) -> None:
-        """Start transcription in background thread."""
-        # Clean up any previous thread
-        self._cleanup_thread()
-
-        # Create worker and thread
         self._thread = QThread()
         self._worker = TranscriptionWorker()
-        self._worker.set_audio_path(audio_path)
-        self._worker.set_model_size(self._model_size)
         self._worker.moveToThread(self._thread)
+        self._thread.finished.connect(self._worker.deleteLater)
 
         # Connect signals
-        self._thread.started.connect(self._worker.run)
-        self._worker.finished.connect(self._on_finished)
-        self._worker.error.connect(self._on_error)
-        self._worker.progress.connect(self.transcription_progress.emit)
-        self._worker.finished.connect(self._thread.quit)
-        self._worker.error.connect(self._thread.quit)
-
-        # Start
-        self.transcription_started.emit()
+        queued = Qt.ConnectionType.QueuedConnection
+        self._transcribe_requested.connect(self._worker.transcribe, queued)
+        self._warm_up_requested.connect(self._worker.warm_up, queued)
+        self._worker.finished.connect(self.transcription_finished)
+        self._worker.error.connect(self.transcription_error)
+        self._worker.progress.connect(self.transcription_progress)
+
         self._thread.start()
 
-    def _on_finished(self, text: str) -> None:
-        """Handle transcription completion."""
-        self.transcription_finished.emit(text)
-        self._cleanup_thread()
-
-    def _on_error(self, error: str) -> None:
-        """Handle transcription error."""
-        self.transcription_error.emit(error)
-        self._cleanup_thread()
-
-    def _cleanup_thread(self) -> None:
-        """Clean up thread and worker."""
-        if self._thread is not None:
-            if self._thread.isRunning():
-                self._thread.quit()
-                self._thread.wait()
-            self._thread.deleteLater()
-            self._thread = None
-        if self._worker is not None:
-            self._worker.deleteLater()
-            self._worker = None
+    def set_model_size(self, size: str) -> None:
+        """Set the Whisper model size."""
+        self._model_size = size
+
+    def warm_up(self) -> None:
+        """Load the model and audio filter in the background ahead of first use."""
+        self._warm_up_requested.emit(self._model_size)
+
+    def transcribe(self, audio: NDArray[np.float32]) -> None:
+        """Queue transcription of the samples on the background thread."""
+        self.transcription_started.emit()
+        self._transcribe_requested.emit(audio, self._model_size)
+
+    def shutdown(self) -> None:
+        """Stop the worker thread, letting any running job finish first."""
+        if self._thread.isRunning():
+            self._thread.quit()
+            self._thread.wait()
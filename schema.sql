@@ -184,6 +184,96 @@ SELECT
 FROM notes n
 LEFT JOIN folder_path fp ON n.parent_id = fp.id
 /* v_note_id_path_mapping(id,title,syntax,user_id,full_path) */;
+-- Materialised v_note_id_path_mapping, so searches don't rebuild every path
+-- with the recursive CTE. Populate an existing database once with:
+--   INSERT INTO t_note_id_path_mapping
+--   SELECT id, title, syntax, user_id, full_path
+--   FROM v_note_id_path_mapping WHERE full_path IS NOT NULL;
+CREATE TABLE t_note_id_path_mapping (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    syntax TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    full_path TEXT NOT NULL
+);
+CREATE TRIGGER note_path_mapping_insert
+AFTER INSERT ON notes
+BEGIN
+    INSERT INTO t_note_id_path_mapping
+    SELECT id, title, syntax, user_id, full_path
+    FROM v_note_id_path_mapping
+    WHERE id = new.id AND full_path IS NOT NULL;
+END;
+CREATE TRIGGER note_path_mapping_update
+AFTER UPDATE OF id, title, syntax, parent_id, user_id ON notes
+BEGIN
+    DELETE FROM t_note_id_path_mapping WHERE id = old.id;
+    INSERT INTO t_note_id_path_mapping
+    SELECT id, title, syntax, user_id, full_path
+    FROM v_note_id_path_mapping
+    WHERE id = new.id AND full_path IS NOT NULL;
+END;
+CREATE TRIGGER note_path_mapping_delete
+AFTER DELETE ON notes
+BEGIN
+    DELETE FROM t_note_id_path_mapping WHERE id = old.id;
+END;
+-- Folder changes only affect the paths of notes in that folder's subtree.
+-- A new folder can give a path to notes that were added before it.
+CREATE TRIGGER folder_path_mapping_insert
+AFTER INSERT ON folders
+WHEN EXISTS (SELECT 1 FROM notes WHERE parent_id = new.id)
+    OR EXISTS (SELECT 1 FROM folders WHERE parent_id = new.id)
+BEGIN
+    INSERT OR REPLACE INTO t_note_id_path_mapping
+    SELECT id, title, syntax, user_id, full_path
+    FROM v_note_id_path_mapping
+    WHERE full_path IS NOT NULL AND id IN (
+        WITH RECURSIVE subtree(id) AS (
+            SELECT new.id
+            UNION
+            SELECT f.id FROM folders f JOIN subtree s ON f.parent_id = s.id
+        )
+        SELECT n.id FROM notes n JOIN subtree s ON n.parent_id = s.id
+    );
+END;
+CREATE TRIGGER folder_path_mapping_update
+AFTER UPDATE OF title, parent_id ON folders
+BEGIN
+    DELETE FROM t_note_id_path_mapping WHERE id IN (
+        WITH RECURSIVE subtree(id) AS (
+            SELECT new.id
+            UNION
+            SELECT f.id FROM folders f JOIN subtree s ON f.parent_id = s.id
+        )
+        SELECT n.id FROM notes n JOIN subtree s ON n.parent_id = s.id
+    );
+    INSERT INTO t_note_id_path_mapping
+    SELECT id, title, syntax, user_id, full_path
+    FROM v_note_id_path_mapping
+    WHERE full_path IS NOT NULL AND id IN (
+        WITH RECURSIVE subtree(id) AS (
+            SELECT new.id
+            UNION
+            SELECT f.id FROM folders f JOIN subtree s ON f.parent_id = s.id
+        )
+        SELECT n.id FROM notes n JOIN subtree s ON n.parent_id = s.id
+    );
+END;
+-- Cascaded deletes remove notes through note_path_mapping_delete; this
+-- covers notes left behind when foreign keys are off
+CREATE TRIGGER folder_path_mapping_delete
+AFTER DELETE ON folders
+BEGIN
+    DELETE FROM t_note_id_path_mapping WHERE id IN (
+        WITH RECURSIVE subtree(id) AS (
+            SELECT old.id
+            UNION
+            SELECT f.id FROM folders f JOIN subtree s ON f.parent_id = s.id
+        )
+        SELECT n.id FROM notes n JOIN subtree s ON n.parent_id = s.id
+    );
+END;
 CREATE TABLE tags (
     id TEXT PRIMARY KEY,
     title TEXT NOT NULL,
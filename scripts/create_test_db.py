@@ -79,6 +79,103 @@ def create_database(db_path: Path) -> None:
         LEFT JOIN folder_path fp ON n.parent_id = fp.id
     """)
 
+    # Materialise the path view so searches don't rebuild every path with
+    # the recursive CTE; triggers keep it current as notes/folders change
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS t_note_id_path_mapping (
+            id TEXT PRIMARY KEY,
+            title TEXT NOT NULL,
+            syntax TEXT NOT NULL,
+            user_id TEXT NOT NULL,
+            full_path TEXT NOT NULL
+        )
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS note_path_mapping_insert
+        AFTER INSERT ON notes BEGIN
+            INSERT INTO t_note_id_path_mapping
+            SELECT id, title, syntax, user_id, full_path
+            FROM v_note_id_path_mapping
+            WHERE id = new.id AND full_path IS NOT NULL;
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS note_path_mapping_update
+        AFTER UPDATE OF id, title, syntax, parent_id, user_id ON notes BEGIN
+            DELETE FROM t_note_id_path_mapping WHERE id = old.id;
+            INSERT INTO t_note_id_path_mapping
+            SELECT id, title, syntax, user_id, full_path
+            FROM v_note_id_path_mapping
+            WHERE id = new.id AND full_path IS NOT NULL;
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS note_path_mapping_delete
+        AFTER DELETE ON notes BEGIN
+            DELETE FROM t_note_id_path_mapping WHERE id = old.id;
+        END
+    """)
+    # Folder changes only touch the notes in that folder's subtree; a new
+    # folder can give a path to notes that were added before it
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS folder_path_mapping_insert
+        AFTER INSERT ON folders
+        WHEN EXISTS (SELECT 1 FROM notes WHERE parent_id = new.id)
+            OR EXISTS (SELECT 1 FROM folders WHERE parent_id = new.id)
+        BEGIN
+            INSERT OR REPLACE INTO t_note_id_path_mapping
+            SELECT id, title, syntax, user_id, full_path
+            FROM v_note_id_path_mapping
+            WHERE full_path IS NOT NULL AND id IN (
+                WITH RECURSIVE subtree(id) AS (
+                    SELECT new.id
+                    UNION
+                    SELECT f.id FROM folders f JOIN subtree s ON f.parent_id = s.id
+                )
+                SELECT n.id FROM notes n JOIN subtree s ON n.parent_id = s.id
+            );
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS folder_path_mapping_update
+        AFTER UPDATE OF title, parent_id ON folders BEGIN
+            DELETE FROM t_note_id_path_mapping WHERE id IN (
+                WITH RECURSIVE subtree(id) AS (
+                    SELECT new.id
+                    UNION
+                    SELECT f.id FROM folders f JOIN subtree s ON f.parent_id = s.id
+                )
+                SELECT n.id FROM notes n JOIN subtree s ON n.parent_id = s.id
+            );
+            INSERT INTO t_note_id_path_mapping
+            SELECT id, title, syntax, user_id, full_path
+            FROM v_note_id_path_mapping
+            WHERE full_path IS NOT NULL AND id IN (
+                WITH RECURSIVE subtree(id) AS (
+                    SELECT new.id
+                    UNION
+                    SELECT f.id FROM folders f JOIN subtree s ON f.parent_id = s.id
+                )
+                SELECT n.id FROM notes n JOIN subtree s ON n.parent_id = s.id
+            );
+        END
+    """)
+    # Cascaded deletes go through note_path_mapping_delete; this covers notes
+    # left behind when foreign keys are off
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS folder_path_mapping_delete
+        AFTER DELETE ON folders BEGIN
+            DELETE FROM t_note_id_path_mapping WHERE id IN (
+                WITH RECURSIVE subtree(id) AS (
+                    SELECT old.id
+                    UNION
+                    SELECT f.id FROM folders f JOIN subtree s ON f.parent_id = s.id
+                )
+                SELECT n.id FROM notes n JOIN subtree s ON n.parent_id = s.id
+            );
+        END
+    """)
+
     # Insert sample folders
     user_id = "test-user"
 
@@ -147,11 +244,11 @@ def create_database(db_path: Path) -> None:
 
     print(f"Created test database at {db_path}")
 
-    # Verify the view works
+    # Verify the materialised paths work
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
     cursor.execute(
-        "SELECT id, title, full_path FROM v_note_id_path_mapping ORDER BY full_path"
+        "SELECT id, title, full_path FROM t_note_id_path_mapping ORDER BY full_path"
     )
     print("\nSample data:")
     for row in cursor.fetchall():